@@ -1,11 +1,17 @@
 import asyncio
 import logging
-import json
 from typing import Any
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
-from .tools import WebCrawlerTools
+from .tools import WebCrawlerTools, _dump
+
+# uvloop (libuv-based event loop) roughly halves asyncio overhead per socket
+# operation; fall back to the stock loop where it isn't available (Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -55,6 +61,16 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Language of the articles",
                         "default": "en"
+                    },
+                    "concurrency": {
+                        "type": "integer",
+                        "description": "Maximum number of articles crawled in parallel",
+                        "default": 10
+                    },
+                    "nlp": {
+                        "type": "boolean",
+                        "description": "Run summary/keyword extraction per article",
+                        "default": False
                     }
                 },
                 "required": ["urls"]
@@ -137,7 +153,9 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         elif name == "extract_multiple_news_articles":
             result = await crawler_tools.extract_multiple_news_articles(
                 arguments.get("urls"),
-                arguments.get("language", "en")
+                arguments.get("language", "en"),
+                arguments.get("concurrency", 10),
+                arguments.get("nlp", False)
             )
         elif name == "discover_news_from_rss":
             result = await crawler_tools.discover_news_from_rss(
@@ -161,7 +179,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         return [TextContent(type="text", text=result)]
 
     except Exception as e:
-        error_result = json.dumps({
+        error_result = _dump({
             "success": False,
             "error": str(e)
         })
@@ -192,4 +210,6 @@ async def main():
         await crawler_tools.close_session()
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
\ No newline at end of file
@@ -1,10 +1,20 @@
 import asyncio
-import json
+import concurrent.futures
+import io
+import os
+import re
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from typing import List, Dict, Any, Optional
+from urllib.parse import urlparse
 import aiohttp
+import lxml.html
+import orjson
+from dateutil import parser as date_parser
 from newspaper import Article, Config
 from newspaper.article import ArticleException
-import feedparser
+from readability import Document
 from bs4 import BeautifulSoup
 import logging
 
@@ -12,105 +22,542 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Compiled query patterns, cached across search calls; dict.setdefault is
+# atomic under the GIL so no extra lock is needed
+_QUERY_PATTERNS: Dict[str, re.Pattern] = {}
+
+def _query_pattern(query: str) -> re.Pattern:
+    """Case-insensitive literal pattern for a search query, compiled once."""
+    pattern = _QUERY_PATTERNS.get(query)
+    if pattern is None:
+        if len(_QUERY_PATTERNS) >= 256:
+            _QUERY_PATTERNS.clear()
+        pattern = _QUERY_PATTERNS.setdefault(query, re.compile(re.escape(query), re.IGNORECASE))
+    return pattern
+
+def _dump(obj: Any) -> str:
+    """
+    Serialize a tool response with orjson, which skips the slow Python
+    formatter path json.dumps takes for indent=2.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str).decode()
+
+def _dump_bytes(obj: Any) -> bytes:
+    """orjson-encode one element of an incrementally assembled JSON array."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+
+def _join_parts(parts: List[bytes]) -> str:
+    """Assemble pre-serialized array elements without re-encoding them."""
+    return (b'[' + b','.join(parts) + b']').decode()
+
+def _stream_parse_feed(data: bytes, max_entries: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Incrementally parse RSS/Atom bytes with ElementTree.iterparse, run in a
+    worker thread. Emits one small dict per <item>/<entry> instead of
+    materializing feedparser's full object tree, which matters on large feeds.
+
+    Because the parse is streaming, max_entries stops it as soon as enough
+    items have been seen — a 10-item cap on an 800-entry feed skips nearly
+    all of the parse work.
+    """
+    entries = []
+
+    for _, elem in ET.iterparse(io.BytesIO(data), events=('end',)):
+        tag = elem.tag.rsplit('}', 1)[-1]
+        if tag not in ('item', 'entry'):
+            continue
+
+        entry = {}
+        for child in elem:
+            name = child.tag.rsplit('}', 1)[-1]
+            if name == 'link':
+                # RSS carries the URL as text, Atom as an href attribute
+                entry.setdefault('link', (child.text or '').strip() or child.get('href'))
+            elif name == 'title':
+                entry.setdefault('title', child.text)
+            elif name in ('pubDate', 'published', 'updated'):
+                try:
+                    entry.setdefault('published', date_parser.parse(child.text).isoformat())
+                except (TypeError, ValueError, OverflowError):
+                    entry.setdefault('published', child.text)
+            elif name in ('description', 'summary'):
+                entry.setdefault('summary', child.text)
+
+        if entry.get('link'):
+            entries.append(entry)
+        elem.clear()
+
+        if max_entries is not None and len(entries) >= max_entries:
+            break
+
+    return entries
+
+def _make_article_config(fetch_images: bool = True) -> Config:
+    """
+    Build a newspaper Config. Module-level so process-pool workers can
+    construct their own copy instead of unpickling a shared one.
+
+    fetch_images controls whether parse() extracts images at all; it lives
+    on the Config, which worker threads read concurrently, so image-skipping
+    callers get a separate instance rather than a per-call toggle.
+    """
+    config = Config()
+    config.browser_user_agent = _USER_AGENT
+    config.request_timeout = 10
+    # Use the C lxml parser rather than the ~10x slower pure-Python fallback
+    config.parser_class = 'lxml'
+    config.fetch_images = fetch_images
+    # Article memoization and raw HTML retention are never needed
+    config.memoize_articles = False
+    config.keep_article_html = False
+    return config
+
+def _parse_worker(url: str, html: str, language: str,
+                  do_nlp: bool = True, do_images: bool = True) -> Dict[str, Any]:
+    """
+    Process-pool entry point for _parse_from_html: takes only picklable
+    arguments and builds the Config inside the worker.
+    """
+    return _parse_from_html(url, html, _make_article_config(fetch_images=do_images),
+                            language, do_nlp, do_images)
+
+def _fast_text(html: str) -> str:
+    """
+    Cheap first-pass extraction of title plus main content via
+    readability-lxml, used to test query matches before paying for
+    newspaper's full parse and NLP.
+
+    The readability summary is flattened to plain text so queries can't
+    false-positive on tag names, attributes or link URLs, and phrases split
+    by inline markup still match.
+    """
+    doc = Document(html)
+    content = lxml.html.fromstring(doc.summary()).text_content()
+    return f"{doc.short_title()}\n{content}"
+
+def _parse_from_html(url: str, html: str, config: Config, language: str,
+                     do_nlp: bool = True, do_images: bool = True) -> Dict[str, Any]:
+    """
+    Blocking newspaper4k parse/NLP over already-fetched HTML, run in a worker
+    thread so the event loop stays free to drive other crawls.
+
+    NLP (summary/keywords) and image/movie extraction are each skippable:
+    callers that only need the article text avoid the most expensive steps,
+    and the corresponding fields come back empty.
+    """
+    article = Article(url, config=config, language=language)
+
+    article.set_html(html)
+    article.parse()
+    if do_nlp:
+        article.nlp()  # Perform natural language processing
+
+    return {
+        'url': url,
+        'title': article.title,
+        'text': article.text,
+        'summary': article.summary if do_nlp else None,
+        'keywords': article.keywords if do_nlp else None,
+        'authors': article.authors,
+        'publish_date': str(article.publish_date) if article.publish_date else None,
+        'top_image': article.top_image if do_images else None,
+        'images': list(article.images) if do_images else None,
+        'movies': article.movies if do_images else None,
+        'meta_description': article.meta_description,
+        'meta_lang': article.meta_lang,
+        'meta_favicon': article.meta_favicon,
+        'meta_keywords': article.meta_keywords,
+        'canonical_link': article.canonical_link,
+        'success': True
+    }
+
 class WebCrawlerTools:
     def __init__(self):
         self.session = None
-        # Configure newspaper4k
-        self.article_config = Config()
-        self.article_config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        self.article_config.request_timeout = 10
+        # Configure newspaper4k: the full Config extracts images, the text
+        # Config skips them for do_images=False paths
+        self.article_config = _make_article_config()
+        self._text_config = _make_article_config(fetch_images=False)
+        # Per-host politeness: at most 2 concurrent fetches against any one
+        # host. Entries are refcounted like the URL locks and dropped once
+        # the last fetch for that host finishes, so the map stays bounded.
+        self._host_semaphores = {}
+        # LRU cache of parsed articles keyed by (url, language), revalidated
+        # with conditional GETs; per-key locks coalesce duplicate fetches.
+        # Lock entries are refcounted and dropped once the last holder
+        # releases, so the map stays bounded unlike the cache it guards.
+        self._article_cache = OrderedDict()
+        self._cache_max = 512
+        self._url_locks = {}
+        # Dedicated pool for CPU-bound parse/NLP work, sized to the machine:
+        # more threads than cores just adds GIL contention and context
+        # switches, and unbounded to_thread would spawn them freely
+        self._cpu_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4, thread_name_prefix='parse')
+        # Process pool for batch parse/NLP: the Python-level tokenization in
+        # article.nlp() holds the GIL, so batches only scale across cores in
+        # separate processes. Workers are spawned lazily on first submit.
+        self._proc_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 4)
 
     async def init_session(self):
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            # Shared connection pool with keep-alive and DNS caching so
+            # repeated crawls against the same hosts skip TCP/TLS handshakes.
+            # The long keepalive matters for RSS flows where dozens of
+            # articles come from a single origin.
+            connector = aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=10,
+                ttl_dns_cache=600,
+                use_dns_cache=True,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=15, connect=5),
+                headers={'User-Agent': _USER_AGENT}
+            )
 
     async def close_session(self):
         if self.session:
             await self.session.close()
+        self._cpu_pool.shutdown(wait=False)
+        self._proc_pool.shutdown(wait=False)
 
-    async def crawl_news_article(self, url: str, language: str = 'en') -> str:
+    async def _run_cpu(self, fn, *args):
+        """Run a CPU-bound callable on the dedicated parse pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cpu_pool, fn, *args)
+
+    async def _parse_feed(self, rss_url: str,
+                          max_entries: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Extract and parse news articles using newspaper4k library.
-        
-        Args:
-            url: The URL of the news article to crawl
-            language: Language of the article (default: 'en')
-        
-        Returns:
-            JSON string containing article title, text, authors, publish date, etc.
+        Fetch an RSS/Atom feed over the shared session and return up to
+        max_entries of its entries as small dicts (link, title, published,
+        summary).
+        """
+        await self.init_session()
+        async with self.session.get(rss_url) as resp:
+            resp.raise_for_status()
+            data = await resp.read()
+
+        return await self._run_cpu(_stream_parse_feed, data, max_entries)
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str):
+        """
+        Per-host politeness slot (at most 2 concurrent fetches per netloc).
+        Semaphore entries are refcounted [semaphore, holders] and removed
+        when the last fetch for the host finishes.
+        """
+        netloc = urlparse(url).netloc
+        entry = self._host_semaphores.get(netloc)
+        if entry is None:
+            entry = self._host_semaphores[netloc] = [asyncio.Semaphore(2), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                self._host_semaphores.pop(netloc, None)
+
+    def _acquire_url_lock(self, cache_key):
+        """
+        Refcounted per-key lock entry [lock, holders]: the last holder
+        (acquired or queued) must call _release_url_lock so the map can't
+        outgrow the cache it guards.
+        """
+        entry = self._url_locks.get(cache_key)
+        if entry is None:
+            entry = self._url_locks[cache_key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        return entry
+
+    def _release_url_lock(self, cache_key, entry):
+        entry[1] -= 1
+        if entry[1] == 0:
+            self._url_locks.pop(cache_key, None)
+
+    async def _revalidated_fetch(self, url: str, cache_key):
+        """
+        Conditional GET against the article cache. Callers must hold the
+        per-key lock.
+
+        Returns (article, None, None, None) when the cached entry revalidates
+        with a 304, else (None, html, etag, last_modified) for a fresh body
+        the caller should parse and _cache_store under the same key.
+        """
+        await self.init_session()
+        cached = self._article_cache.get(cache_key)
+
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        async with self.session.get(url, headers=headers) as resp:
+            if cached and resp.status == 304:
+                logger.info(f"Cache hit (304 Not Modified): {url}")
+                self._article_cache.move_to_end(cache_key)
+                return cached['article'], None, None, None
+
+            resp.raise_for_status()
+            etag = resp.headers.get('ETag')
+            last_modified = resp.headers.get('Last-Modified')
+            html = await resp.text()
+
+        return None, html, etag, last_modified
+
+    async def _fetch_and_parse(self, url: str, language: str,
+                               do_nlp: bool = True, do_images: bool = True,
+                               use_processes: bool = False) -> Dict[str, Any]:
+        """
+        Fetch and parse one article, serving repeats from the LRU cache.
+
+        Cached entries are revalidated with If-None-Match/If-Modified-Since;
+        a 304 response counts as a hit and skips the download, parse and NLP
+        passes entirely. The per-key lock ensures concurrent requests for the
+        same URL share a single fetch.
+        """
+        cache_key = (url, language, do_nlp, do_images)
+        entry = self._acquire_url_lock(cache_key)
+
+        try:
+            async with entry[0]:
+                cached, html, etag, last_modified = await self._revalidated_fetch(url, cache_key)
+                if cached is not None:
+                    return cached
+
+                # Offload the blocking parse/NLP so the loop isn't stalled; batch
+                # callers get the process pool for true multi-core scaling
+                if use_processes:
+                    loop = asyncio.get_running_loop()
+                    result = await loop.run_in_executor(
+                        self._proc_pool, _parse_worker, url, html, language, do_nlp, do_images)
+                else:
+                    config = self.article_config if do_images else self._text_config
+                    result = await self._run_cpu(
+                        _parse_from_html, url, html, config, language, do_nlp, do_images)
+
+                self._cache_store(cache_key, result, etag, last_modified)
+
+                return result
+        finally:
+            self._release_url_lock(cache_key, entry)
+
+    def _cache_store(self, cache_key, article: Dict[str, Any],
+                     etag: Optional[str], last_modified: Optional[str]):
+        """Insert a parsed article into the LRU, evicting the oldest entries."""
+        self._article_cache[cache_key] = {
+            'article': article,
+            'etag': etag,
+            'last_modified': last_modified
+        }
+        self._article_cache.move_to_end(cache_key)
+        while len(self._article_cache) > self._cache_max:
+            self._article_cache.popitem(last=False)
+
+    async def _crawl_article_dict(self, url: str, language: str = 'en',
+                                  do_nlp: bool = True, do_images: bool = True,
+                                  use_processes: bool = False) -> Dict[str, Any]:
+        """
+        Crawl one article and return the result as a plain dict.
+
+        Internal callers consume this directly so article data moves through
+        the pipeline without a dumps/loads round-trip per hop; JSON
+        serialization happens once, at the MCP boundary.
         """
         try:
             logger.info(f"Crawling news article: {url}")
-            
-            # Create article object
-            article = Article(url, config=self.article_config, language=language)
-            
-            # Download and parse
-            article.download()
-            article.parse()
-            article.nlp()  # Perform natural language processing
-            
-            result = {
+
+            return await self._fetch_and_parse(url, language, do_nlp, do_images, use_processes)
+
+        except aiohttp.ClientError as e:
+            return {
                 'url': url,
-                'title': article.title,
-                'text': article.text,
-                'summary': article.summary,
-                'keywords': article.keywords,
-                'authors': article.authors,
-                'publish_date': str(article.publish_date) if article.publish_date else None,
-                'top_image': article.top_image,
-                'images': list(article.images),
-                'movies': article.movies,
-                'meta_description': article.meta_description,
-                'meta_lang': article.meta_lang,
-                'meta_favicon': article.meta_favicon,
-                'meta_keywords': article.meta_keywords,
-                'canonical_link': article.canonical_link,
-                'success': True
+                'success': False,
+                'error': f"Download error: {str(e)}"
             }
-            
-            return json.dumps(result, indent=2, default=str)
-            
         except ArticleException as e:
-            error_result = {
+            return {
                 'url': url,
                 'success': False,
                 'error': f"Newspaper4k error: {str(e)}"
             }
-            return json.dumps(error_result, indent=2)
         except Exception as e:
-            error_result = {
+            return {
                 'url': url,
                 'success': False,
                 'error': f"Unexpected error: {str(e)}"
             }
-            return json.dumps(error_result, indent=2)
 
-    async def extract_multiple_news_articles(self, urls: List[str], language: str = 'en') -> str:
+    async def crawl_news_article(self, url: str, language: str = 'en') -> str:
+        """
+        Extract and parse news articles using newspaper4k library.
+
+        Args:
+            url: The URL of the news article to crawl
+            language: Language of the article (default: 'en')
+
+        Returns:
+            JSON string containing article title, text, authors, publish date, etc.
+        """
+        return _dump(await self._crawl_article_dict(url, language))
+
+    async def extract_multiple_news_articles(self, urls: List[str], language: str = 'en',
+                                             concurrency: int = 10, nlp: bool = False) -> str:
         """
         Extract multiple news articles at once.
-        
+
+        NLP is off by default here: summaries and keywords are rarely needed
+        in bulk and cost a large share of the per-article CPU. Pass nlp=True
+        to populate them.
+
         Args:
             urls: List of URLs to crawl
             language: Language of the articles (default: 'en')
-        
+            concurrency: Maximum number of articles crawled in parallel (default: 10)
+            nlp: Whether to run summary/keyword extraction per article (default: False)
+
         Returns:
             JSON string containing results for all articles
         """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def crawl_one(url: str):
+            async with semaphore:
+                return await self._crawl_article_dict(
+                    url, language, do_nlp=nlp, do_images=False, use_processes=True)
+
+        raw_results = await asyncio.gather(*[crawl_one(url) for url in urls], return_exceptions=True)
+
         results = []
-        
-        for url in urls:
-            try:
-                article_result = await self.crawl_news_article(url, language)
-                results.append(json.loads(article_result))
-            except Exception as e:
+        for url, raw in zip(urls, raw_results):
+            if isinstance(raw, Exception):
                 results.append({
                     'url': url,
                     'success': False,
-                    'error': str(e)
+                    'error': str(raw)
                 })
-        
-        return json.dumps(results, indent=2, default=str)
+            else:
+                results.append(raw)
+
+        return _dump(results)
+
+    async def _iter_feed_articles(self, entries: List[Dict[str, Any]]):
+        """
+        Crawl feed entries through a bounded fetch -> parse pipeline and
+        yield article dicts as they complete.
+
+        Fetch workers overlap network waits with the parse workers' CPU-bound
+        newspaper runs, so steady-state throughput tracks the slowest stage
+        instead of their sum. The bounded queue between the stages is the
+        backpressure: at most a handful of raw HTML payloads are resident at
+        once, however large the feed.
+        """
+        fetch_q = asyncio.Queue()
+        parse_q = asyncio.Queue(maxsize=16)
+        results_q = asyncio.Queue()
+
+        def attach_rss(article, entry):
+            # Copy before annotating so cached dicts are never mutated
+            return {
+                **article,
+                'rss_title': entry.get('title'),
+                'rss_published': entry.get('published'),
+                'rss_summary': entry.get('summary')
+            }
+
+        async def fetch_worker():
+            while True:
+                entry = await fetch_q.get()
+                if entry is None:
+                    break
+                url = entry['link']
+                cache_key = (url, 'en', True, True)
+                # The per-URL lock is held from fetch through parse (released
+                # by the parse worker), so a link repeated in the feed or a
+                # concurrent direct crawl of the same URL coalesces instead
+                # of fetching and parsing twice
+                lock_entry = self._acquire_url_lock(cache_key)
+                locked = handed_off = False
+                try:
+                    await lock_entry[0].acquire()
+                    locked = True
+
+                    async with self._host_slot(url):
+                        logger.info(f"Processing article: {url}")
+                        cached, html, etag, last_modified = await self._revalidated_fetch(url, cache_key)
+
+                    if cached is not None:
+                        await results_q.put(attach_rss(cached, entry))
+                    else:
+                        await parse_q.put((entry, html, etag, last_modified, cache_key, lock_entry))
+                        handed_off = True
+                except aiohttp.ClientError as e:
+                    await results_q.put(attach_rss(
+                        {'url': url, 'success': False, 'error': f"Download error: {str(e)}"}, entry))
+                except Exception as e:
+                    await results_q.put(attach_rss(
+                        {'url': url, 'success': False, 'error': f"Unexpected error: {str(e)}"}, entry))
+                finally:
+                    if not handed_off:
+                        if locked:
+                            lock_entry[0].release()
+                        self._release_url_lock(cache_key, lock_entry)
+
+        async def parse_worker():
+            while True:
+                item = await parse_q.get()
+                if item is None:
+                    break
+                entry, html, etag, last_modified, cache_key, lock_entry = item
+                url = entry['link']
+                try:
+                    article = await self._run_cpu(
+                        _parse_from_html, url, html, self.article_config, 'en', True, True)
+                    self._cache_store(cache_key, article, etag, last_modified)
+                except Exception as e:
+                    article = {'url': url, 'success': False, 'error': f"Newspaper4k error: {str(e)}"}
+                finally:
+                    lock_entry[0].release()
+                    self._release_url_lock(cache_key, lock_entry)
+                await results_q.put(attach_rss(article, entry))
+
+        await self.init_session()
+        fetchers = [asyncio.create_task(fetch_worker()) for _ in range(min(8, len(entries)))]
+        parsers = [asyncio.create_task(parse_worker()) for _ in range(os.cpu_count() or 4)]
+
+        async def drive():
+            for entry in entries:
+                await fetch_q.put(entry)
+            for _ in fetchers:
+                await fetch_q.put(None)
+            await asyncio.gather(*fetchers)
+            for _ in parsers:
+                await parse_q.put(None)
+            await asyncio.gather(*parsers)
+            await results_q.put(None)
+
+        driver = asyncio.create_task(drive())
+        try:
+            while True:
+                article = await results_q.get()
+                if article is None:
+                    break
+                yield article
+        finally:
+            driver.cancel()
+            for task in fetchers + parsers:
+                task.cancel()
 
     async def discover_news_from_rss(self, rss_url: str, max_articles: int = 10) -> str:
         """
@@ -125,46 +572,34 @@ class WebCrawlerTools:
         """
         try:
             logger.info(f"Parsing RSS feed: {rss_url}")
-            
-            # Parse RSS feed
-            feed = feedparser.parse(rss_url)
-            
-            if feed.entries:
-                results = []
-                articles_to_process = min(max_articles, len(feed.entries))
-                
-                for i, entry in enumerate(feed.entries[:articles_to_process]):
-                    if hasattr(entry, 'link'):
-                        logger.info(f"Processing article {i+1}/{articles_to_process}: {entry.link}")
-                        
-                        # Extract full article content
-                        article_data = await self.crawl_news_article(entry.link)
-                        article_json = json.loads(article_data)
-                        
-                        # Add RSS metadata
-                        article_json['rss_title'] = entry.title if hasattr(entry, 'title') else None
-                        article_json['rss_published'] = entry.published if hasattr(entry, 'published') else None
-                        article_json['rss_summary'] = entry.summary if hasattr(entry, 'summary') else None
-                        
-                        results.append(article_json)
-                    
-                    # Small delay to be respectful to the server
-                    await asyncio.sleep(1)
-                
-                return json.dumps(results, indent=2, default=str)
+
+            # Fetch the feed bytes asynchronously, then stream-parse them in
+            # a thread so neither download nor parse blocks the loop; the
+            # parse stops after max_articles entries
+            entries = await self._parse_feed(rss_url, max_articles)
+
+            if entries:
+                # Serialize each article the moment it completes so only its
+                # bytes stay resident, not every parsed dict at once
+                parts = [
+                    _dump_bytes(article)
+                    async for article in self._iter_feed_articles(entries)
+                ]
+
+                return _join_parts(parts)
             else:
-                return json.dumps({
+                return _dump({
                     'success': False,
                     'error': 'No entries found in RSS feed',
                     'rss_url': rss_url
-                }, indent=2)
+                })
                 
         except Exception as e:
-            return json.dumps({
+            return _dump({
                 'success': False,
                 'error': f"RSS parsing error: {str(e)}",
                 'rss_url': rss_url
-            }, indent=2)
+            })
 
     async def search_and_extract_news(self, query: str, rss_feeds: List[str] = None, max_results: int = 5) -> str:
         """
@@ -186,30 +621,89 @@ class WebCrawlerTools:
                 'https://rss.nytimes.com/services/xml/rss/nyt/HomePage.xml'
             ]
         
-        all_articles = []
-        
-        for rss_feed in rss_feeds:
-            try:
-                feed_articles = await self.discover_news_from_rss(rss_feed, max_results)
-                articles_data = json.loads(feed_articles)
-                
-                if isinstance(articles_data, list):
-                    all_articles.extend(articles_data)
-            except Exception as e:
-                logger.error(f"Error processing RSS feed {rss_feed}: {e}")
-        
-        # Filter articles based on search query
-        query_lower = query.lower()
-        matching_articles = []
-        
-        for article in all_articles:
-            if (article.get('success') and 
-                (query_lower in article.get('title', '').lower() or 
-                 query_lower in article.get('text', '').lower() or
-                 query_lower in article.get('summary', '').lower())):
-                matching_articles.append(article)
-        
-        return json.dumps(matching_articles[:max_results], indent=2, default=str)
+        # Parse all feeds concurrently, then dedupe article URLs so stories
+        # syndicated across feeds are fetched and parsed only once
+        feed_entry_lists = await asyncio.gather(
+            *[self._parse_feed(rss_feed, max_results) for rss_feed in rss_feeds],
+            return_exceptions=True
+        )
+
+        urls = []
+        seen = set()
+        for rss_feed, entries in zip(rss_feeds, feed_entry_lists):
+            if isinstance(entries, Exception):
+                logger.error(f"Error processing RSS feed {rss_feed}: {entries}")
+                continue
+            for entry in entries:
+                if entry['link'] not in seen:
+                    seen.add(entry['link'])
+                    urls.append(entry['link'])
+
+        # Match with one compiled case-insensitive scan rather than separate
+        # Python-level substring passes that each re-lowercase the text;
+        # repeated queries reuse the cached compiled pattern
+        pattern = _query_pattern(query)
+        semaphore = asyncio.Semaphore(5)
+
+        async def fetch_article(url):
+            # Cheap readability first pass decides whether the query matches;
+            # newspaper's full parse + NLP runs only for keepers, reusing the
+            # already-downloaded HTML. The fetch revalidates against the
+            # article cache and keepers are stored back, so repeated searches
+            # 304 instead of re-downloading and re-parsing.
+            cache_key = (url, 'en', True, True)
+            async with semaphore:
+                lock_entry = self._acquire_url_lock(cache_key)
+                try:
+                    async with lock_entry[0]:
+                        async with self._host_slot(url):
+                            # Catch everything: timeouts raise asyncio.TimeoutError and
+                            # resp.text() can fail on a bad charset declaration, and
+                            # any escape here would abort the whole search
+                            try:
+                                cached, html, etag, last_modified = await self._revalidated_fetch(url, cache_key)
+                            except Exception as e:
+                                logger.error(f"Error fetching article {url}: {e}")
+                                return None
+
+                        if cached is not None:
+                            haystack = '\n'.join((
+                                cached.get('title') or '',
+                                cached.get('text') or '',
+                                cached.get('summary') or ''
+                            ))
+                            return cached if pattern.search(haystack) else None
+
+                        try:
+                            if not pattern.search(await self._run_cpu(_fast_text, html)):
+                                return None
+                            article = await self._run_cpu(
+                                _parse_from_html, url, html, self.article_config, 'en')
+                            self._cache_store(cache_key, article, etag, last_modified)
+                            return article
+                        except Exception as e:
+                            logger.error(f"Error parsing article {url}: {e}")
+                            return None
+                finally:
+                    self._release_url_lock(cache_key, lock_entry)
+
+        # Consume matches as they complete and stop at max_results, cancelling
+        # whatever is still in flight instead of crawling it to throw it away
+        tasks = [asyncio.ensure_future(fetch_article(url)) for url in urls]
+        matching_parts = []
+        try:
+            for task in asyncio.as_completed(tasks):
+                article = await task
+                if article is None:
+                    continue
+                matching_parts.append(_dump_bytes(article))
+                if len(matching_parts) >= max_results:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return _join_parts(matching_parts)
 
     async def get_news_summary(self, url: str, summary_length: int = 5) -> str:
         """
@@ -223,9 +717,9 @@ class WebCrawlerTools:
             JSON string containing article summary and key information
         """
         try:
-            article_data = await self.crawl_news_article(url)
-            article_json = json.loads(article_data)
-            
+            # Summaries need NLP but never the image set
+            article_json = await self._crawl_article_dict(url, do_images=False)
+
             if article_json.get('success'):
                 # Use newspaper4k's built-in summary or create our own
                 summary = article_json.get('summary', '')
@@ -245,13 +739,13 @@ class WebCrawlerTools:
                     'success': True
                 }
                 
-                return json.dumps(result, indent=2, default=str)
+                return _dump(result)
             else:
-                return article_data
+                return _dump(article_json)
                 
         except Exception as e:
-            return json.dumps({
+            return _dump({
                 'url': url,
                 'success': False,
                 'error': f"Summary extraction error: {str(e)}"
-            }, indent=2)
\ No newline at end of file
+            })
\ No newline at end of file